@@ -0,0 +1,38 @@
+"""add_content_bytes_to_file_assets
+
+Revision ID: b752e0d1c6a4
+Revises: e9a31c64f5d8
+Create Date: 2026-08-27 12:31:08.664951
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b752e0d1c6a4'
+down_revision: Union[str, None] = 'e9a31c64f5d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Store decoded raw bytes alongside the base64 text so the render path
+    # can skip per-read decoding; text content stays for API compatibility
+    op.add_column('file_assets', sa.Column('content_bytes', sa.LargeBinary(), nullable=True))
+
+    # Backfill existing base64 assets (decode() is PostgreSQL-specific)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE file_assets SET content_bytes = decode(content, 'base64') "
+            "WHERE content_encoding = 'base64'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('file_assets', 'content_bytes')
@@ -0,0 +1,43 @@
+"""add_partial_indexes_for_active_file_assets
+
+Revision ID: c41d2f8a9b37
+Revises: 8e1299cafca1
+Create Date: 2026-08-27 10:12:45.103482
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d2f8a9b37'
+down_revision: Union[str, None] = '8e1299cafca1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial indexes over live (non-deleted) assets: create_for_file scans
+    # by file_id on every private render, list_user_assets scans by owner_id
+    op.create_index(
+        'file_assets_file_id_active_idx',
+        'file_assets',
+        ['file_id'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'file_assets_owner_id_active_idx',
+        'file_assets',
+        ['owner_id'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('file_assets_owner_id_active_idx', table_name='file_assets')
+    op.drop_index('file_assets_file_id_active_idx', table_name='file_assets')
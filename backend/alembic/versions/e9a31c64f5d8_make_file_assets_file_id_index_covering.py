@@ -0,0 +1,45 @@
+"""make_file_assets_file_id_index_covering
+
+Revision ID: e9a31c64f5d8
+Revises: c41d2f8a9b37
+Create Date: 2026-08-27 11:04:17.529814
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a31c64f5d8'
+down_revision: Union[str, None] = 'c41d2f8a9b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Recreate the live-asset file_id index with INCLUDEd metadata columns so
+    # create_for_file can resolve filename/content_encoding from the index
+    # alone; content stays in the heap where TOAST defers its cost
+    op.drop_index('file_assets_file_id_active_idx', table_name='file_assets')
+    op.create_index(
+        'file_assets_file_id_active_idx',
+        'file_assets',
+        ['file_id'],
+        postgresql_include=['filename', 'content_encoding'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('file_assets_file_id_active_idx', table_name='file_assets')
+    op.create_index(
+        'file_assets_file_id_active_idx',
+        'file_assets',
+        ['file_id'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
@@ -0,0 +1,39 @@
+"""add_updated_at_to_file_assets
+
+Revision ID: f3a8c21d7e95
+Revises: b752e0d1c6a4
+Create Date: 2026-08-27 16:42:19.118207
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c21d7e95'
+down_revision: Union[str, None] = 'b752e0d1c6a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Last-write timestamp; content updates bump it so the asset resolver
+    # cache signature moves in every worker process
+    op.add_column(
+        'file_assets',
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('file_assets', 'updated_at')
@@ -71,6 +71,9 @@ class Settings(BaseSettings):
     COPILOT_PROVIDER: str = Field("anthropic", json_schema_extra={"env": "COPILOT_PROVIDER"})
     """AI provider for copilot functionality (anthropic, openai, etc.)."""
 
+    RENDER_POOL_WORKERS: int = Field(0, json_schema_extra={"env": "RENDER_POOL_WORKERS"})
+    """Worker processes for CPU-bound RSM rendering (0 renders inline on the event loop)."""
+
     model_config = SettingsConfigDict(extra="forbid", env_file=".env")
 
     def get_test_database_url(self) -> str:
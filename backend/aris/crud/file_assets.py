@@ -1,12 +1,13 @@
-import base64
-import binascii
-from datetime import UTC, datetime
+import re
+from datetime import datetime
 from typing import Any, List, Optional
 
+import pybase64
 from pydantic import BaseModel, field_validator, model_validator
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ..logging_config import get_logger
 from ..models import FileAsset
@@ -15,27 +16,57 @@ from ..models import FileAsset
 logger = get_logger(__name__)
 
 
+def _decoded_bytes(content: str, content_encoding: str) -> Optional[bytes]:
+    """Return the stored bytes for an encoded payload, or None for plain content.
+
+    Decoding happens once at write time so the render path never has to.
+    For zstd payloads the bytes stay compressed at rest; the resolver
+    decompresses them on load.
+    """
+    if content_encoding not in ("base64", "zstd"):
+        return None
+    return pybase64.b64decode(content)
+
+
+# Standard base64 alphabet with up to two trailing padding characters; a
+# fullmatch is both necessary and sufficient for a decodable payload
+_B64_RE = re.compile(rb"^[A-Za-z0-9+/]*={0,2}$")
+
+
+def _check_base64(value: str) -> None:
+    """Raise ValueError if value is not a valid base64 payload.
+
+    The ASCII encode plus regex fullmatch is a pair of C-level scans that
+    fully validates the payload without running a decode; the write path can
+    then decode without re-validating.
+    """
+    try:
+        encoded = value.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Invalid base64-encoded string")
+    if len(encoded) % 4 != 0 or not _B64_RE.fullmatch(encoded):
+        raise ValueError("Invalid base64-encoded string")
+
+
 class FileAssetCreate(BaseModel):
     filename: str
     mime_type: str
     content: str
-    content_encoding: str = "plain"  # "plain" or "base64"
+    content_encoding: str = "plain"  # "plain", "base64", or "zstd"
     file_id: int
 
     @field_validator("content_encoding")
     @classmethod
     def validate_content_encoding(cls, v):
-        if v not in ("plain", "base64"):
-            raise ValueError("content_encoding must be 'plain' or 'base64'")
+        if v not in ("plain", "base64", "zstd"):
+            raise ValueError("content_encoding must be 'plain', 'base64', or 'zstd'")
         return v
 
     @model_validator(mode="after")
     def validate_base64_content(self):
-        if self.content_encoding == "base64":
-            try:
-                base64.b64decode(self.content)
-            except (TypeError, binascii.Error):
-                raise ValueError("Invalid base64-encoded string")
+        # zstd content travels as base64-encoded compressed bytes
+        if self.content_encoding in ("base64", "zstd"):
+            _check_base64(self.content)
         return self
 
 
@@ -49,8 +80,8 @@ class FileAssetUpdate(BaseModel):
         if v is None:
             return v
         try:
-            base64.b64decode(v)
-        except (TypeError, binascii.Error):
+            _check_base64(v)
+        except ValueError:
             logger.warning("Content is not base64 decodable")
         return v
 
@@ -59,10 +90,7 @@ class FileAssetUpdate(BaseModel):
     def validate_content_strict(cls, v):
         if v is None:
             return v
-        try:
-            base64.b64decode(v)
-        except (TypeError, binascii.Error):
-            raise ValueError("Invalid base64-encoded string")
+        _check_base64(v)
         return v
 
 
@@ -93,15 +121,48 @@ class FileAssetDB:
             filename=payload.filename,
             mime_type=payload.mime_type,
             content=payload.content,
+            content_bytes=_decoded_bytes(payload.content, payload.content_encoding),
             content_encoding=payload.content_encoding,
             file_id=payload.file_id,
             owner_id=user_id,
         )
         db.add(new_asset)
+        # eager_defaults on FileAsset fills server-generated fields at flush,
+        # so no refresh SELECT is needed after the commit
+        await db.flush()
         await db.commit()
-        await db.refresh(new_asset)
         return new_asset
 
+    @staticmethod
+    async def create_assets(
+        payloads: List[FileAssetCreate], user_id: int, db: AsyncSession
+    ) -> List[FileAsset]:
+        """Create multiple file assets in a single statement and transaction.
+
+        One INSERT with all rows (batched via insertmanyvalues on backends
+        that support it) instead of a round-trip and commit per asset.
+        """
+        if not payloads:
+            return []
+        result = await db.execute(
+            insert(FileAsset).returning(FileAsset, sort_by_parameter_order=True),
+            [
+                {
+                    "filename": payload.filename,
+                    "mime_type": payload.mime_type,
+                    "content": payload.content,
+                    "content_bytes": _decoded_bytes(payload.content, payload.content_encoding),
+                    "content_encoding": payload.content_encoding,
+                    "file_id": payload.file_id,
+                    "owner_id": user_id,
+                }
+                for payload in payloads
+            ],
+        )
+        new_assets = list(result.scalars().all())
+        await db.commit()
+        return new_assets
+
     @staticmethod
     async def list_user_assets(user_id: int, db: AsyncSession) -> List[FileAsset]:
         """List all non-deleted assets for a user"""
@@ -119,14 +180,34 @@ class FileAssetDB:
             asset.filename = payload.filename
         if payload.content is not None:
             asset.content = payload.content
+            asset.content_bytes = _decoded_bytes(payload.content, str(asset.content_encoding))
         if payload.deleted_at is not None:
             asset.deleted_at = payload.deleted_at
+        # The caller already holds the attached object with its new values;
+        # sessions run with expire_on_commit=False, so no refresh is needed.
+        # The flush bumps updated_at, which moves the asset signature and
+        # invalidates cached resolvers in every worker process.
         await db.commit()
-        await db.refresh(asset)
         return asset
 
     @staticmethod
-    async def soft_delete_asset(asset: FileAsset, db: AsyncSession) -> None:
-        """Soft delete an asset by setting deleted_at timestamp"""
-        asset.deleted_at = datetime.now(UTC)
+    async def soft_delete_asset(asset_id: int, db: AsyncSession) -> None:
+        """Soft delete an asset by setting deleted_at timestamp.
+
+        A single UPDATE by id with the server clock as the authoritative
+        timestamp; the asset is not hydrated into the session.
+        """
+        result = await db.execute(
+            update(FileAsset)
+            .where(FileAsset.id == asset_id)
+            .values(deleted_at=func.now())
+            .returning(FileAsset.deleted_at)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_at = result.scalar_one_or_none()
         await db.commit()
+        # The UPDATE bypassed the identity map; push the returned timestamp
+        # into any loaded copy of this asset so it stays consistent
+        for obj in list(db.identity_map.values()):
+            if isinstance(obj, FileAsset) and obj.id == asset_id:
+                set_committed_value(obj, "deleted_at", deleted_at)
@@ -1,3 +1,7 @@
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import time
 from pathlib import Path
 from typing import Optional
@@ -6,78 +10,192 @@ import rsm
 from rsm.asset_resolver import AssetResolver
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import settings
 from ..logging_config import get_logger
-from ..services.asset_resolver import FileAssetResolver
+from ..services.asset_resolver import FileAssetResolver, referenced_asset_paths
 
 
 logger = get_logger(__name__)
 
 
+# Process-level memo of rendered HTML keyed by (source hash, resolver content
+# key). Rendering is a pure function of the source and the assets it can see,
+# so identical inputs short-circuit to the cached output.
+_RENDER_CACHE_MAX_SIZE = 512
+_render_cache: dict[tuple[str, str], str] = {}
+
+
+def invalidate_render_cache() -> None:
+    """Drop all memoized render results.
+
+    Cache keys already include a digest of the resolver's asset contents, so
+    asset edits never serve stale HTML; this hook exists for tests that
+    monkeypatch rsm.render and would otherwise see results memoized under an
+    earlier patch.
+    """
+    _render_cache.clear()
+
+
+def _render_cache_get(src: str, resolver_key: str) -> tuple[tuple[str, str], Optional[str]]:
+    """Return the cache key for this render and the memoized HTML, if any."""
+    key = (hashlib.sha256(src.encode()).hexdigest(), resolver_key)
+    return key, _render_cache.get(key)
+
+
+def _render_cache_store(key: tuple[str, str], html: str) -> None:
+    """Memoize a successful render, evicting oldest entries beyond the cap."""
+    while len(_render_cache) >= _RENDER_CACHE_MAX_SIZE:
+        _render_cache.pop(next(iter(_render_cache)))
+    _render_cache[key] = html
+
+
+@functools.cache
+def _rsm_static_dir() -> Path:
+    """Find RSM static directory, works with both PyPI and editable installs.
+
+    The answer never changes within a process, so the probe runs once.
+    """
+    rsm_module_path = Path(rsm.__file__).parent
+    static_dir = rsm_module_path / "static"
+    if static_dir.exists():
+        return static_dir
+
+    # Fallback to site-packages if static dir not found
+    fallback_dir = Path(".venv/lib/python3.13/site-packages/rsm/static")
+    if fallback_dir.exists():
+        return fallback_dir
+
+    raise RuntimeError(f"RSM static directory not found. Tried: {static_dir}, {fallback_dir}")
+
+
 class StaticFileAssetResolver(AssetResolver):
     """Asset resolver that fetches assets from static files on the file system."""
-    
+
     def __init__(self):
         """Initialize resolver."""
         # Use the same RSM static directory resolution as main.py
-        self.static_dir = Path(self._find_rsm_static_dir())
-    
-    def _find_rsm_static_dir(self):
-        """Find RSM static directory, works with both PyPI and editable installs."""
-        import rsm
-        rsm_module_path = Path(rsm.__file__).parent
-        static_dir = rsm_module_path / "static"
-        if static_dir.exists():
-            return str(static_dir)
-        
-        # Fallback to site-packages if static dir not found
-        fallback_dir = Path(".venv/lib/python3.13/site-packages/rsm/static")
-        if fallback_dir.exists():
-            return str(fallback_dir)
-        
-        raise RuntimeError(f"RSM static directory not found. Tried: {static_dir}, {fallback_dir}")
-        
+        self.static_dir = _rsm_static_dir()
+
     def resolve_asset(self, path: str) -> Optional[str]:
         """Resolve an asset path to its content from static files.
-        
+
         Parameters
         ----------
         path
             The filename of the asset to resolve (e.g., "research_metrics_chart.html")
-            
+
         Returns
         -------
         Optional[str]
             The asset content as a string, or None if not found
         """
+        return self._load_static(path)
+
+    @functools.lru_cache(maxsize=256)
+    def _load_static(self, path: str) -> Optional[str]:
+        """Read a static asset from disk, caching contents for repeated renders.
+
+        Static assets never change while the process is running, so hot assets
+        are served from the cache without touching the filesystem.
+        """
+        # Reject traversal outside the static directory before touching the filesystem
+        parts = Path(path).parts
+        if Path(path).is_absolute() or ".." in parts:
+            logger.warning(f"Rejected static asset path: {path}")
+            return None
+
         try:
-            # Construct full path to static file
-            asset_path = self.static_dir / path
-            
-            # Check if file exists and read content
-            if asset_path.exists() and asset_path.is_file():
-                content = asset_path.read_text(encoding='utf-8')
-                logger.info(f"Loaded static asset {path}: {len(content)} chars")
-                return content
-            else:
-                logger.warning(f"Static asset not found: {asset_path}")
-                return None
-                
+            content = (self.static_dir / path).read_text(encoding='utf-8')
+            logger.debug("Loaded static asset %s: %d chars", path, len(content))
+            return content
+        except FileNotFoundError:
+            logger.warning(f"Static asset not found: {self.static_dir / path}")
+            return None
         except (OSError, UnicodeDecodeError, PermissionError) as e:
             logger.error(f"Failed to resolve static asset {path}: {e}")
             return None
 
 
+# Shared resolver for the public endpoint: constructing one probes the
+# filesystem for the RSM static directory, so do it once at import time.
+_STATIC_RESOLVER = StaticFileAssetResolver()
+
+
+def _render_sync(src: str, asset_resolver: AssetResolver) -> str:
+    """Run the CPU-bound RSM render; executed inside pool workers."""
+    return rsm.render(src, handrails=True, asset_resolver=asset_resolver)
+
+
+@functools.cache
+def _render_pool() -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    """Process pool for RSM rendering, or None when rendering inline."""
+    if settings.RENDER_POOL_WORKERS <= 0:
+        return None
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=settings.RENDER_POOL_WORKERS, initializer=_warm_worker
+    )
+
+
+def _warm_worker() -> None:
+    """Pool worker initializer: pay rsm's one-time setup at spawn, not first task."""
+    try:
+        rsm.render(":rsm: warmup ::", handrails=True)
+    except rsm.RSMApplicationError:
+        pass
+
+
+def warm_render() -> None:
+    """Force rsm's lazy one-time setup before the first request.
+
+    Renders a trivial document inline and, when a render pool is configured,
+    spawns a worker so the remaining workers warm through their initializer.
+    Called from the app's lifespan startup hook.
+    """
+    try:
+        rsm.render(":rsm: warmup ::", handrails=True)
+    except rsm.RSMApplicationError as e:
+        logger.warning(f"RSM warmup render failed: {e}")
+    pool = _render_pool()
+    if pool is not None:
+        pool.submit(_warm_worker)
+
+
+async def _run_render(src: str, asset_resolver: AssetResolver) -> str:
+    """Render on the process pool if configured, inline otherwise.
+
+    rsm.render is CPU-bound pure Python; running it on the event loop
+    serializes every concurrent request behind it. With RENDER_POOL_WORKERS
+    set, renders run in parallel across cores and the loop stays free for
+    I/O. Resolvers are plain picklable objects with their assets pre-loaded,
+    so they cross the process boundary as data.
+    """
+    pool = _render_pool()
+    if pool is None:
+        return rsm.render(src, handrails=True, asset_resolver=asset_resolver)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, _render_sync, src, asset_resolver)
+
+
 async def render(src: str):
     """Render RSM source to HTML with static file asset resolution."""
+    # Empty input renders to nothing; skip the RSM engine's setup cost
+    if not src or not src.strip():
+        return ""
+
+    # Static assets never change within a process, so the source hash alone
+    # identifies the output
+    key, cached = _render_cache_get(src, "static")
+    if cached is not None:
+        return cached
+
     logger.debug(f"Starting RSM render for {len(src)} characters")
     start_time = time.time()
-    
+
     try:
-        # Create static file asset resolver for public endpoint
-        asset_resolver = StaticFileAssetResolver()
-        result = rsm.render(src, handrails=True, asset_resolver=asset_resolver)
+        result = await _run_render(src, _STATIC_RESOLVER)
         render_time = time.time() - start_time
         logger.debug(f"RSM render completed successfully in {render_time:.3f}s")
+        _render_cache_store(key, result)
     except rsm.RSMApplicationError as e:
         render_time = time.time() - start_time
         logger.error(f"RSM render failed after {render_time:.3f}s: {e}")
@@ -87,16 +205,34 @@ async def render(src: str):
 
 async def render_with_assets(src: str, file_id: int, db: AsyncSession, user_id: int):
     """Render RSM source to HTML with database asset resolution."""
+    # Empty input renders to nothing; skip the RSM engine's setup cost
+    if not src or not src.strip():
+        return ""
+
     logger.debug(f"Starting RSM render with assets for {len(src)} characters, file_id={file_id}")
     start_time = time.time()
-    
+
     try:
-        # Create asset resolver for this file with pre-loaded assets
-        asset_resolver = await FileAssetResolver.create_for_file(file_id, db)
-        
-        result = rsm.render(src, handrails=True, asset_resolver=asset_resolver)
+        # Pre-load only the assets the source actually references; a source
+        # with no references never consults the database at all
+        referenced = referenced_asset_paths(src)
+        if referenced:
+            asset_resolver = await FileAssetResolver.create_for_file(
+                file_id, db, filenames=referenced
+            )
+        else:
+            asset_resolver = FileAssetResolver({})
+
+        # The resolver's content key digests the decoded assets, so edits
+        # produce a new key and can never serve stale memoized HTML
+        key, cached = _render_cache_get(src, asset_resolver.content_key)
+        if cached is not None:
+            return cached
+
+        result = await _run_render(src, asset_resolver)
         render_time = time.time() - start_time
         logger.debug(f"RSM render with assets completed successfully in {render_time:.3f}s")
+        _render_cache_store(key, result)
     except rsm.RSMApplicationError as e:
         render_time = time.time() - start_time
         logger.error(f"RSM render with assets failed after {render_time:.3f}s: {e}")
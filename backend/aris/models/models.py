@@ -18,6 +18,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Table,
     Text,
@@ -389,10 +390,15 @@ class FileAsset(Base):
         MIME type (e.g., image/png).
     content : str
         File contents (stored inline).
+    content_bytes : bytes
+        Decoded raw contents for base64 assets, stored once at write time so
+        renders skip the per-read decode.
     content_encoding : str
         Content encoding format ("plain" or "base64").
     uploaded_at : datetime
         Timestamp of upload.
+    updated_at : datetime
+        Timestamp of the last write; drives asset cache invalidation.
     deleted_at : datetime
         Soft delete marker.
     owner_id : int
@@ -406,16 +412,34 @@ class FileAsset(Base):
     """
 
     __tablename__ = "file_assets"
+    # Populate server defaults (uploaded_at) via RETURNING at flush time,
+    # so creation does not need a refresh round-trip
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("file_id", "filename", name="uq_file_asset_filename_per_file"),
+        Index(
+            "file_assets_file_id_active_idx",
+            "file_id",
+            postgresql_include=["filename", "content_encoding"],
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "file_assets_owner_id_active_idx",
+            "owner_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     filename = Column(String, nullable=False)
     mime_type = Column(String, nullable=False)
     content = Column(Text, nullable=False)
+    content_bytes = Column(LargeBinary, nullable=True)
     content_encoding = Column(String, nullable=False, default="plain")
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
     deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     owner_id = Column(
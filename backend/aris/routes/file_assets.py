@@ -27,6 +27,14 @@ async def upload_asset(
     return new_asset
 
 
+@router.post("/batch", response_model=List[FileAssetOut])
+async def upload_assets(
+    payloads: List[FileAssetCreate], db: AsyncSession = Depends(get_db), user=Depends(current_user)
+):
+    new_assets = await FileAssetDB.create_assets(payloads, user.id, db)
+    return new_assets
+
+
 @router.get("", response_model=List[FileAssetOut])
 async def list_assets(db: AsyncSession = Depends(get_db), user=Depends(current_user)):
     assets = await FileAssetDB.list_user_assets(user.id, db)
@@ -55,5 +63,5 @@ async def soft_delete_asset(
     asset_id: int, db: AsyncSession = Depends(get_db), user=Depends(current_user)
 ):
     asset = await get_user_asset_or_404(asset_id, user.id, db)
-    await FileAssetDB.soft_delete_asset(asset, db)
+    await FileAssetDB.soft_delete_asset(asset.id, db)
     return {"message": f"Asset {asset_id} soft deleted"}
@@ -1,5 +1,6 @@
 """Routes for rendering RSM into HTML."""
 
+import rsm
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -36,8 +37,6 @@ async def render(data: RenderObject):
         format: "html" returns plain HTML, "structured" returns {head, body, init_script}
     """
     if data.format == "structured":
-        # Import rsm here to avoid circular imports
-        import rsm
         try:
             structured_content = rsm.make(data.source, handrails=True, structured=True)
             if not isinstance(structured_content, dict):
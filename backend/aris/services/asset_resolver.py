@@ -4,12 +4,19 @@ This module provides asset resolution for RSM rendering by fetching assets
 from the database instead of the filesystem.
 """
 
-import base64
+import asyncio
 import binascii
+import hashlib
 import logging
+import re
+import time
+from types import MappingProxyType
 from typing import Optional
 
+import pybase64
+import zstandard
 from rsm.asset_resolver import AssetResolver
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.models import FileAsset
@@ -18,94 +25,231 @@ from ..models.models import FileAsset
 logger = logging.getLogger(__name__)
 
 
+# Process-level cache of resolvers keyed by file_id. An entry is reused only
+# while the file's asset signature (row count and latest timestamps) matches,
+# so repeated renders of an unchanged file skip the full asset load and cost
+# a single aggregate query instead.
+_CACHE_MAX_SIZE = 512
+_CACHE_TTL_SECONDS = 300
+_resolver_cache: dict[int, tuple[tuple, float, "FileAssetResolver"]] = {}
+_resolver_cache_lock = asyncio.Lock()
+
+
+# A path runs to the end of its line and may contain spaces; require a
+# non-blank first character so an empty :path: tag captures nothing
+_ASSET_PATH_RE = re.compile(r':path:[ \t]*(\S(?:.*\S)?)[ \t]*$', re.MULTILINE)
+
+# Reused across loads to amortize context initialization; decompression only
+# ever runs on the event-loop thread
+_zstd_decompressor = zstandard.ZstdDecompressor()
+
+
+def referenced_asset_paths(src: str) -> set[str]:
+    """Extract the asset filenames referenced by ``:path:`` tags in RSM source.
+
+    Lets the render path load content only for assets the source actually
+    uses instead of everything attached to the file. Filenames may contain
+    spaces, so each reference is the whole rest of its line, trimmed.
+    """
+    return set(_ASSET_PATH_RE.findall(src))
+
+
+def invalidate_cache(file_id: Optional[int] = None) -> None:
+    """Drop the cached resolver for one file, or for all files if no id is given.
+
+    Asset writes move the aggregate signature on their own (``updated_at``
+    bumps on content updates), so this is mainly for tests, which use it to
+    keep the process-level cache from leaking state across test databases.
+    """
+    if file_id is None:
+        _resolver_cache.clear()
+    else:
+        _resolver_cache.pop(file_id, None)
+
+
+def _rebuild_resolver(decoded: dict[str, str]) -> "FileAssetResolver":
+    """Reconstruct a resolver from already-decoded assets (unpickling helper)."""
+    return FileAssetResolver({path: (content, "plain") for path, content in decoded.items()})
+
+
 class FileAssetResolver(AssetResolver):
     """Simple asset resolver that fetches assets from the database.
     
     This resolver loads all assets for a given file_id upfront and provides
-    synchronous access to them.
+    synchronous access to them. ``resolve_asset`` is bound per instance to
+    the asset dict's ``get``, so each lookup during render is a single
+    C-level hash probe with no Python frame.
     """
-    
-    def __init__(self, assets: dict[str, tuple[str, str]]):
+
+    __slots__ = ("_assets", "content_key", "resolve_asset")
+
+    def __init__(self, assets: dict[str, tuple[str | bytes, str]]):
         """Initialize resolver with pre-loaded assets.
-        
+
         Parameters
         ----------
         assets
-            Dictionary mapping asset filenames to (content, encoding) tuples
+            Dictionary mapping asset filenames to (content, encoding) tuples,
+            where encoding is "plain", "base64", "zstd", or "bytes" for raw
+            content. Encoded entries are decoded once here, so lookups never
+            re-decode.
         """
-        self._assets = assets
-        
-    def resolve_asset(self, path: str) -> Optional[str]:
-        """Resolve an asset path to its content.
-        
-        Parameters
-        ----------
-        path
-            The filename of the asset to resolve
-            
-        Returns
-        -------
-        Optional[str]
-            The asset content as a string, or None if not found
-        """
-        asset_info = self._assets.get(path)
-        if not asset_info:
-            return None
-            
-        content, encoding = asset_info
-        if encoding == "base64":
-            try:
-                return base64.b64decode(content).decode('utf-8')
-            except (binascii.Error, UnicodeDecodeError) as e:
-                logger.error(f"Failed to decode base64 asset {path}: {e}")
-                return None
-        else:  # plain
-            return content
-    
+        decoded: dict[str, str] = {}
+        # The isinstance checks mirror the encoding tags ("bytes" and "zstd"
+        # content is bytes, "base64" and "plain" is str) and narrow the
+        # union for mypy
+        for path, (content, encoding) in assets.items():
+            if encoding == "bytes" and isinstance(content, bytes):
+                # Raw bytes from the content_bytes column, already decoded
+                try:
+                    decoded[path] = content.decode('utf-8')
+                except UnicodeDecodeError as e:
+                    logger.error(f"Failed to decode raw asset {path}: {e}")
+            elif encoding == "zstd" and isinstance(content, bytes):
+                try:
+                    decoded[path] = _zstd_decompressor.decompress(content).decode('utf-8')
+                except (zstandard.ZstdError, UnicodeDecodeError) as e:
+                    logger.error(f"Failed to decompress zstd asset {path}: {e}")
+            elif encoding == "base64":
+                try:
+                    # Single-pass SIMD decode + validation via pybase64
+                    decoded[path] = pybase64.b64decode(content, validate=True).decode('utf-8')
+                except (binascii.Error, ValueError, UnicodeDecodeError) as e:
+                    logger.error(f"Failed to decode base64 asset {path}: {e}")
+            elif isinstance(content, str):  # plain
+                decoded[path] = content
+        # Freeze the decoded assets: the resolver is read-only for its whole
+        # lifetime, and the cached instances must not be mutable by callers
+        self._assets = MappingProxyType(decoded)
+        # Digest of the decoded assets; identifies this resolver's view of
+        # the world for render memoization
+        hasher = hashlib.blake2b(digest_size=16)
+        for path in sorted(decoded):
+            hasher.update(path.encode())
+            hasher.update(b"\0")
+            hasher.update(decoded[path].encode())
+        self.content_key = hasher.hexdigest()
+        # Bound get satisfies the resolve_asset protocol directly: missing
+        # paths return None with a single C-level hash probe
+        self.resolve_asset = self._assets.get
+
+    def __reduce__(self):
+        # mappingproxy and its bound methods do not pickle; rebuild from the
+        # decoded contents when crossing the render pool's process boundary
+        return (_rebuild_resolver, (dict(self._assets),))
+
     @classmethod
-    async def create_for_file(cls, file_id: int, db: AsyncSession) -> 'FileAssetResolver':
+    async def create_for_file(
+        cls,
+        file_id: int,
+        db: AsyncSession,
+        filenames: Optional[set[str]] = None,
+    ) -> 'FileAssetResolver':
         """Create an asset resolver for a specific file.
-        
+
         Parameters
         ----------
         file_id
             The ID of the file whose assets should be resolved
         db
             Database session for querying assets
-            
+        filenames
+            Optional set of asset filenames to load. RSM's resolve_asset hook
+            is synchronous, so content cannot be fetched lazily mid-render;
+            callers that know which assets a source references can pass them
+            here to avoid loading content for the rest.
+
         Returns
         -------
         FileAssetResolver
-            Resolver with all assets pre-loaded
+            Resolver with the requested assets pre-loaded
         """
         try:
-            # Query all assets for this file
-            from sqlalchemy import select
-            result = await db.execute(
-                select(FileAsset)
+            # Cheap aggregate signature: changes whenever assets are added,
+            # updated, or soft-deleted, letting unchanged files reuse the
+            # cached resolver across every worker process.
+            signature_result = await db.execute(
+                select(
+                    func.count(FileAsset.id),
+                    func.max(FileAsset.uploaded_at),
+                    func.max(FileAsset.updated_at),
+                    func.max(FileAsset.deleted_at),
+                ).where(FileAsset.file_id == file_id)
+            )
+            requested = frozenset(filenames) if filenames is not None else None
+            signature = (requested, *signature_result.one())
+
+            async with _resolver_cache_lock:
+                cached = _resolver_cache.get(file_id)
+                if cached is not None:
+                    cached_signature, cached_at, resolver = cached
+                    if (
+                        cached_signature == signature
+                        and time.monotonic() - cached_at < _CACHE_TTL_SECONDS
+                    ):
+                        logger.debug(f"Reusing cached resolver for file {file_id}")
+                        return resolver
+                    del _resolver_cache[file_id]
+
+            # Query just the columns the resolver needs, skipping ORM
+            # instance construction for potentially large content blobs
+            query = (
+                select(
+                    FileAsset.filename,
+                    FileAsset.content,
+                    FileAsset.content_bytes,
+                    FileAsset.content_encoding,
+                )
                 .where(FileAsset.file_id == file_id)
                 .where(FileAsset.deleted_at.is_(None))
             )
-            assets = result.scalars().all()
-            
-            # Create assets dictionary with content and encoding
-            assets_dict: dict[str, tuple[str, str]] = {}
-            for asset in assets:
-                try:
-                    # Store content and encoding as tuple
-                    content = str(asset.content)
-                    encoding = getattr(asset, 'content_encoding', 'plain')  # Default to plain for backward compatibility
-                    assets_dict[str(asset.filename)] = (content, encoding)
-                    logger.info(f"Loaded asset {asset.filename} ({encoding}): {len(content)} chars")
-                except (AttributeError, TypeError, ValueError) as e:
-                    logger.error(f"Failed to load asset {asset.filename} for file {file_id}: {e}")
-                    # Skip this asset if loading fails
-                    continue
-            
-            logger.info(f"Loaded {len(assets_dict)} assets for file {file_id}")
-            
-            return cls(assets_dict)
-            
+            if requested is not None:
+                query = query.where(FileAsset.filename.in_(requested))
+            # Stream rows in batches rather than buffering every content
+            # blob client-side before the loop starts
+            result = await db.stream(query.execution_options(yield_per=100))
+
+            # Build the assets dictionary incrementally from the stream,
+            # preferring pre-decoded raw bytes over the base64 text
+            # representation; no full row list is ever materialized
+            assets_dict: dict[str, tuple[str | bytes, str]] = {}
+            total_chars = 0
+            async for row in result.mappings():
+                filename = row["filename"]
+                content_bytes = row["content_bytes"]
+                encoding = row["content_encoding"]
+                if encoding == "zstd":
+                    # content_bytes holds the compressed frame at rest
+                    raw = (
+                        content_bytes
+                        if content_bytes is not None
+                        else pybase64.b64decode(row["content"])
+                    )
+                    assets_dict[filename] = (raw, "zstd")
+                elif content_bytes is not None:
+                    assets_dict[filename] = (content_bytes, "bytes")
+                else:
+                    assets_dict[filename] = (row["content"], encoding)
+                total_chars += len(row["content"])
+
+            # One summary line instead of a log call per asset; lazy %-style
+            # formatting keeps it free when DEBUG is off
+            logger.debug(
+                "Loaded %d assets (%d chars total) for file %d",
+                len(assets_dict),
+                total_chars,
+                file_id,
+            )
+
+            resolver = cls(assets_dict)
+
+            async with _resolver_cache_lock:
+                while len(_resolver_cache) >= _CACHE_MAX_SIZE:
+                    _resolver_cache.pop(next(iter(_resolver_cache)))
+                _resolver_cache[file_id] = (signature, time.monotonic(), resolver)
+
+            return resolver
+
         except (RuntimeError, OSError) as e:
             logger.error(f"Failed to load assets for file {file_id}: {e}")
-            return cls({})
\ No newline at end of file
+            return cls({})
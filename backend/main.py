@@ -3,14 +3,17 @@
 import importlib
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from aris.crud.render import warm_render
 from aris.deps import get_db
 from aris.health import HealthResponse, perform_health_check
 from aris.logging_config import get_logger, setup_logging
@@ -34,9 +37,20 @@ setup_logging()
 logger = get_logger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-warm the RSM renderer so the first request skips its lazy setup."""
+    warm_render()
+    yield
+
+
 # API metadata for documentation
 logger.info("Starting Aris backend application")
 app = FastAPI(
+    lifespan=lifespan,
+    # orjson serializes responses several times faster than stdlib json,
+    # which matters for rendered-HTML payloads in the 100KB range
+    default_response_class=ORJSONResponse,
     title="Aris API",
     description="""
     **Aris** is a web-native scientific publishing platform that manages research manuscripts
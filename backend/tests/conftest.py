@@ -145,6 +145,19 @@ async def create_database_if_not_exists(database_url: str):
                 await admin_engine.dispose()
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def clear_asset_resolver_cache():
+    """Keep the process-level resolver and render caches from leaking across tests."""
+    from aris.crud.render import invalidate_render_cache
+    from aris.services.asset_resolver import invalidate_cache
+
+    invalidate_cache()
+    invalidate_render_cache()
+    yield
+    invalidate_cache()
+    invalidate_render_cache()
+
+
 @pytest_asyncio.fixture
 async def db_session(test_engine):
     """Create a fresh database for each test."""
@@ -163,6 +176,13 @@ async def db_session(test_engine):
         await conn.run_sync(Base.metadata.drop_all)
 
 
+# One ASGI transport shared by every test client: it is stateless apart from
+# the app reference (no sockets or pools), so constructing it per test only
+# added overhead. Isolation lives in the per-test AsyncClient, which carries
+# the headers and dependency overrides.
+_asgi_transport = httpx.ASGITransport(app=app)
+
+
 @pytest_asyncio.fixture
 async def client(db_session):
     """Create a test client with database dependency override."""
@@ -171,8 +191,7 @@ async def client(db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
-    transport = httpx.ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+    async with AsyncClient(transport=_asgi_transport, base_url="http://test") as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
@@ -31,6 +31,36 @@ async def test_create_asset(db_session, test_user, test_file):
     assert asset.deleted_at is None
 
 
+async def test_create_assets_batch(db_session, test_user, test_file):
+    """Test creating multiple file assets in a single batch"""
+    payloads = [
+        FileAssetCreate(
+            filename=f"batch_{i}.txt",
+            mime_type="text/plain",
+            content="dGVzdCBjb250ZW50",  # base64 encoded "test content"
+            file_id=test_file.id,
+        )
+        for i in range(3)
+    ]
+
+    assets = await FileAssetDB.create_assets(payloads, test_user.id, db_session)
+
+    assert len(assets) == 3
+    for i, asset in enumerate(assets):
+        assert asset.id
+        assert asset.filename == f"batch_{i}.txt"
+        assert asset.file_id == test_file.id
+        assert asset.owner_id == test_user.id
+        assert asset.uploaded_at
+        assert asset.deleted_at is None
+
+
+async def test_create_assets_empty_list(db_session, test_user):
+    """Test that an empty batch creates nothing"""
+    assets = await FileAssetDB.create_assets([], test_user.id, db_session)
+    assert assets == []
+
+
 async def test_get_user_asset(db_session, test_user, test_file):
     """Test getting a user's asset"""
     # Create an asset first
@@ -77,7 +107,7 @@ async def test_get_user_asset_soft_deleted(db_session, test_user, test_file):
         filename="test.txt", mime_type="text/plain", content="dGVzdA==", file_id=test_file.id
     )
     created_asset = await FileAssetDB.create_asset(payload, test_user.id, db_session)
-    await FileAssetDB.soft_delete_asset(created_asset, db_session)
+    await FileAssetDB.soft_delete_asset(created_asset.id, db_session)
 
     # Try to get the soft-deleted asset
     asset = await FileAssetDB.get_user_asset(created_asset.id, test_user.id, db_session)
@@ -139,7 +169,7 @@ async def test_list_user_assets_excludes_soft_deleted(db_session, test_user, tes
     asset2 = await FileAssetDB.create_asset(payload2, test_user.id, db_session)
 
     # Soft delete one asset
-    await FileAssetDB.soft_delete_asset(asset2, db_session)
+    await FileAssetDB.soft_delete_asset(asset2.id, db_session)
 
     assets = await FileAssetDB.list_user_assets(test_user.id, db_session)
 
@@ -197,7 +227,7 @@ async def test_soft_delete_asset(db_session, test_user, test_file):
     assert asset.deleted_at is None
 
     # Soft delete it
-    await FileAssetDB.soft_delete_asset(asset, db_session)
+    await FileAssetDB.soft_delete_asset(asset.id, db_session)
 
     # Refresh to get updated data
     await db_session.refresh(asset)
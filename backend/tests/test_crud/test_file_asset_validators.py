@@ -16,6 +16,20 @@ def test_fileassetcreate_invalid_image_content_raises():
         FileAssetCreate(filename="f.jpg", mime_type="image/jpeg", content="not_base64", content_encoding="base64", file_id=999)
 
 
+def test_fileassetcreate_zstd_content():
+    import zstandard
+
+    compressed = zstandard.ZstdCompressor(level=3).compress(b"<div>big figure</div>")
+    content = base64.b64encode(compressed).decode()
+    payload = FileAssetCreate(filename="f.html", mime_type="text/html", content=content, content_encoding="zstd", file_id=999)
+    assert payload.content == content
+
+
+def test_fileassetcreate_invalid_encoding_raises():
+    with pytest.raises(ValueError):
+        FileAssetCreate(filename="f.txt", mime_type="text/plain", content="abcd", content_encoding="gzip", file_id=999)
+
+
 def test_fileassetcreate_non_image_allows_bad_content():
     payload = FileAssetCreate(
         filename="f.txt", mime_type="text/plain", content="not_base64!", file_id=1
@@ -6,12 +6,34 @@ import rsm
 from aris.crud.render import render
 
 
+def test_render_memoizes_identical_source(monkeypatch):
+    calls = []
+
+    def fake_render(src, handrails=True, asset_resolver=None):
+        calls.append(src)
+        return "<p>OK</p>"
+
+    monkeypatch.setattr(rsm, "render", fake_render)
+    assert asyncio.run(render("src")) == "<p>OK</p>"
+    assert asyncio.run(render("src")) == "<p>OK</p>"
+    assert calls == ["src"]
+
+
 def test_render_success(monkeypatch):
     monkeypatch.setattr(rsm, "render", lambda src, handrails=True, asset_resolver=None: "<p>OK</p>")
     result = asyncio.run(render("src"))
     assert result == "<p>OK</p>"
 
 
+def test_render_empty_source(monkeypatch):
+    def fail(src, handrails=True, asset_resolver=None):
+        raise AssertionError("rsm.render should not be called for empty source")
+
+    monkeypatch.setattr(rsm, "render", fail)
+    assert asyncio.run(render("")) == ""
+    assert asyncio.run(render("   \n ")) == ""
+
+
 def test_render_error(monkeypatch, caplog):
     def raise_error(src, handrails=True, asset_resolver=None):
         raise rsm.RSMApplicationError("fail")
@@ -1,5 +1,6 @@
 """Tests for private render endpoint with asset resolver."""
 
+import rsm
 from httpx import AsyncClient
 
 from aris.models.models import File, FileAsset
@@ -69,6 +70,57 @@ class TestRenderPrivate:
         html_result = response.json()
         assert "Test Figure Content" in html_result
 
+    async def test_render_private_with_spaced_asset_filename(
+        self, client: AsyncClient, authenticated_user, db_session, monkeypatch
+    ):
+        """Test that asset prefetch loads filenames containing spaces."""
+        headers = {"Authorization": f"Bearer {authenticated_user['token']}"}
+
+        # Create a file first
+        file = File(owner_id=authenticated_user['user_id'], source=":rsm: test ::")
+        db_session.add(file)
+        await db_session.commit()
+        await db_session.refresh(file)
+
+        # Create a file asset whose name contains spaces
+        asset = FileAsset(
+            filename="my chart.html",
+            mime_type="text/html",
+            content="<div>Spaced Filename Content</div>",
+            file_id=file.id,
+            owner_id=authenticated_user['user_id']
+        )
+        db_session.add(asset)
+        await db_session.commit()
+
+        # Read through the resolver directly so the assertion covers the
+        # prefetch itself, independent of the figure grammar
+        monkeypatch.setattr(
+            rsm,
+            "render",
+            lambda src, handrails=True, asset_resolver=None: (
+                asset_resolver.resolve_asset("my chart.html") or "asset not loaded"
+            ),
+        )
+
+        rsm_source = """:rsm:
+
+:figure:
+  :path: my chart.html
+
+::
+
+::"""
+
+        response = await client.post(
+            "/render/private",
+            json={"source": rsm_source, "file_id": file.id},
+            headers=headers
+        )
+
+        assert response.status_code == 200
+        assert "Spaced Filename Content" in response.json()
+
     async def test_render_private_missing_file_id(self, client: AsyncClient, authenticated_user):
         """Test private render endpoint requires file_id."""
         headers = {"Authorization": f"Bearer {authenticated_user['token']}"}
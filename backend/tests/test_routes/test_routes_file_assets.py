@@ -53,6 +53,51 @@ async def test_upload_asset_without_auth(client: AsyncClient):
     assert response.status_code == 401
 
 
+async def test_upload_assets_batch(
+    client: AsyncClient, authenticated_user, test_file, valid_base64_text
+):
+    """Test uploading several assets in one batch request."""
+    headers = {"Authorization": f"Bearer {authenticated_user['token']}"}
+    response = await client.post(
+        "/assets/batch",
+        headers=headers,
+        json=[
+            {
+                "filename": f"batch_{i}.txt",
+                "mime_type": "text/plain",
+                "content": valid_base64_text,
+                "file_id": test_file["id"],
+            }
+            for i in range(3)
+        ],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 3
+    for i, asset in enumerate(data):
+        assert asset["filename"] == f"batch_{i}.txt"
+        assert asset["content"] == valid_base64_text
+        assert asset["file_id"] == test_file["id"]
+        assert "id" in asset
+        assert asset["deleted_at"] is None
+
+
+async def test_upload_assets_batch_without_auth(client: AsyncClient):
+    """Test that batch asset upload requires authentication."""
+    response = await client.post(
+        "/assets/batch",
+        json=[
+            {
+                "filename": "test.txt",
+                "mime_type": "text/plain",
+                "content": "SGVsbG8gV29ybGQ=",
+                "file_id": 1,
+            }
+        ],
+    )
+    assert response.status_code == 401
+
+
 async def test_upload_asset_valid_image(
     client: AsyncClient, authenticated_user, test_file, valid_base64_image
 ):
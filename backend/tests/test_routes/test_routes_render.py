@@ -1,9 +1,10 @@
 """Test render routes."""
 
-import tempfile
-from pathlib import Path
+import asyncio
+import re
 from unittest.mock import patch
 
+import orjson
 from httpx import AsyncClient
 
 
@@ -90,18 +91,20 @@ OUTPUT = """
 </body>
 """
 
+# Stripped once at import time; the expected output never changes
+OUTPUT_STRIPPED = OUTPUT.strip()
+
 
 async def test_render(client: AsyncClient):
     """Test that files endpoint requires authentication."""
     response = await client.post("/render", json={"source": ":rsm:foo::"})
     assert response.status_code == 200
-    assert OUTPUT.strip() == response.json().strip()
+    assert OUTPUT_STRIPPED == orjson.loads(response.content).strip()
 
 
-async def test_render_with_static_figure_asset(client: AsyncClient):
-    """Test that public render endpoint resolves figures from static files."""
-    # Test RSM with figure directive pointing to existing static asset
-    rsm_source = """:rsm:
+# Module-level source fixtures: a single str object per skeleton, so repeat
+# renders key into the render memo without rehashing distinct literals
+STATIC_FIGURE_SOURCE = """:rsm:
 # Test Document with Interactive Chart
 
 :figure:
@@ -110,11 +113,45 @@ async def test_render_with_static_figure_asset(client: AsyncClient):
 
 This document demonstrates web-native publishing with interactive figures.
 ::"""
-    
-    response = await client.post("/render", json={"source": rsm_source})
+
+MULTIPLE_FIGURES_SOURCE = """:rsm:
+# Multiple Figures Test
+
+:figure:
+  :path: chart1.html
+::
+
+Some text between figures.
+
+:figure:
+  :path: chart2.html
+::
+
+:figure:
+  :path: chart3.html
+::
+
+End of document.
+::"""
+
+LARGE_FIGURE_SOURCE = """:rsm:
+# Large File Test
+
+:figure:
+  :path: large_chart.html
+::
+
+End of document.
+::"""
+
+
+async def test_render_with_static_figure_asset(client: AsyncClient):
+    """Test that public render endpoint resolves figures from static files."""
+    # Test RSM with figure directive pointing to existing static asset
+    response = await client.post("/render", json={"source": STATIC_FIGURE_SOURCE})
     assert response.status_code == 200
     
-    rendered_html = response.json()
+    rendered_html = orjson.loads(response.content)
     
     # Verify the figure content is included in the response
     assert "Test Document with Interactive Chart" in rendered_html
@@ -125,10 +162,17 @@ This document demonstrates web-native publishing with interactive figures.
     assert "This document demonstrates web-native publishing" in rendered_html
 
 
-async def test_render_with_missing_static_figure_asset(client: AsyncClient):
-    """Test that public render endpoint gracefully handles missing static files."""
-    # Test RSM with figure directive pointing to non-existent file
-    rsm_source = """:rsm:
+# Sensitive-content needles checked in one compiled pass over the body
+# instead of one full substring scan per needle
+FORBIDDEN_CONTENT = re.compile(r"root:|/bin/bash|/bin/sh")
+
+# Independent edge-case sources for the public render endpoint, run
+# concurrently in a single test. Each entry is (source, expected substrings,
+# forbidden-content pattern or None).
+EDGE_CASES = [
+    # Missing static file: renders with an error placeholder for the figure
+    (
+        """:rsm:
 # Test Document
 
 :figure:
@@ -136,26 +180,18 @@ async def test_render_with_missing_static_figure_asset(client: AsyncClient):
 ::
 
 End of document.
-::"""
-    
-    response = await client.post("/render", json={"source": rsm_source})
-    assert response.status_code == 200
-    
-    rendered_html = response.json()
-    
-    # Should render successfully with error message for missing figure
-    # (RSM handles missing assets gracefully with error placeholder)
-    assert "Test Document" in rendered_html
-    assert "End of document" in rendered_html
-    # Should contain error message for missing asset
-    assert "html-error" in rendered_html
-    assert "Unable to load HTML asset: nonexistent_chart.html" in rendered_html
-
-
-async def test_render_with_path_traversal_attempt(client: AsyncClient):
-    """Test that public render endpoint prevents path traversal attacks."""
-    # Test RSM with figure directive attempting path traversal
-    rsm_source = """:rsm:
+::""",
+        [
+            "Test Document",
+            "End of document",
+            "html-error",
+            "Unable to load HTML asset: nonexistent_chart.html",
+        ],
+        None,
+    ),
+    # Path traversal attempt: must not leak system file content
+    (
+        """:rsm:
 # Security Test Document
 
 :figure:
@@ -163,51 +199,27 @@ async def test_render_with_path_traversal_attempt(client: AsyncClient):
 ::
 
 End of document.
-::"""
-    
-    response = await client.post("/render", json={"source": rsm_source})
-    assert response.status_code == 200
-    
-    rendered_html = response.json()
-    
-    # Should render successfully - RSM may skip invalid figures silently
-    # Path traversal should not work - no sensitive content should be included
-    assert "Security Test Document" in rendered_html
-    assert "End of document" in rendered_html
-    # Should not contain any sensitive system file content like /etc/passwd entries
-    assert "root:" not in rendered_html
-    assert "/bin/bash" not in rendered_html
-    assert "/bin/sh" not in rendered_html
-
-
-async def test_render_with_empty_figure_path(client: AsyncClient):
-    """Test that public render endpoint handles empty figure paths gracefully."""
-    # Test RSM with figure directive with empty path
-    rsm_source = """:rsm:
+::""",
+        ["Security Test Document", "End of document"],
+        FORBIDDEN_CONTENT,
+    ),
+    # Empty figure path: handled gracefully
+    (
+        """:rsm:
 # Empty Path Test
 
 :figure:
-  :path: 
+  :path:
 ::
 
 End of document.
-::"""
-    
-    response = await client.post("/render", json={"source": rsm_source})
-    assert response.status_code == 200
-    
-    rendered_html = response.json()
-    
-    # Should render successfully
-    assert "Empty Path Test" in rendered_html
-    assert "End of document" in rendered_html
-    # Should handle empty path gracefully
-
-
-async def test_render_with_special_characters_in_path(client: AsyncClient):
-    """Test that public render endpoint handles special characters in paths."""
-    # Test RSM with figure directive containing special characters
-    rsm_source = """:rsm:
+::""",
+        ["Empty Path Test", "End of document"],
+        None,
+    ),
+    # Special characters in path: error placeholder names the file verbatim
+    (
+        """:rsm:
 # Special Characters Test
 
 :figure:
@@ -215,139 +227,110 @@ async def test_render_with_special_characters_in_path(client: AsyncClient):
 ::
 
 End of document.
-::"""
-    
+::""",
+        [
+            "Special Characters Test",
+            "End of document",
+            "html-error",
+            "Unable to load HTML asset: test file with spaces & symbols!.html",
+        ],
+        None,
+    ),
+]
+
+
+async def _render_and_assert(
+    client: AsyncClient, rsm_source: str, expected: list, forbidden: "re.Pattern | None"
+):
+    """POST a source to /render and check for expected/forbidden content."""
     response = await client.post("/render", json={"source": rsm_source})
     assert response.status_code == 200
-    
-    rendered_html = response.json()
-    
-    # Should render successfully with error for missing file
-    assert "Special Characters Test" in rendered_html
-    assert "End of document" in rendered_html
-    assert "html-error" in rendered_html
-    assert "Unable to load HTML asset: test file with spaces & symbols!.html" in rendered_html
 
+    rendered_html = orjson.loads(response.content)
+    for needle in expected:
+        assert needle in rendered_html, f"missing {needle!r} for source {rsm_source[:60]!r}"
+    if forbidden is not None:
+        match = forbidden.search(rendered_html)
+        assert match is None, f"leaked {match.group(0)!r} for source {rsm_source[:60]!r}"
 
-async def test_render_with_multiple_figures(client: AsyncClient):
-    """Test that public render endpoint handles multiple figures correctly."""
-    # Create temporary static directory and files
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_static_dir = Path(temp_dir)
-        
-        # Create multiple test files
-        test_files = {
-            "chart1.html": "<div class='chart1'>Chart 1 Content</div>",
-            "chart2.html": "<div class='chart2'>Chart 2 Content</div>",
-            "chart3.html": "<div class='chart3'>Chart 3 Content</div>"
-        }
-        
-        for filename, content in test_files.items():
-            (temp_static_dir / filename).write_text(content, encoding='utf-8')
-        
-        # Mock the StaticFileAssetResolver
-        with patch('aris.crud.render.StaticFileAssetResolver') as mock_resolver_class:
-            mock_resolver = mock_resolver_class.return_value
-            
-            def mock_resolve_asset(path: str):
-                asset_path = temp_static_dir / path
-                if asset_path.exists():
-                    return asset_path.read_text(encoding='utf-8')
-                return None
-            
-            mock_resolver.resolve_asset.side_effect = mock_resolve_asset
-            
-            # Test RSM with multiple figure directives
-            rsm_source = """:rsm:
-# Multiple Figures Test
 
-:figure:
-  :path: chart1.html
-::
+async def test_render_edge_cases(client: AsyncClient):
+    """Test missing assets, path traversal, empty and special-character paths.
 
-Some text between figures.
+    The cases share no state or mocks, so the requests are issued
+    concurrently and one request's (de)serialization overlaps another's
+    render work.
+    """
+    await asyncio.gather(
+        *(
+            _render_and_assert(client, source, expected, forbidden)
+            for source, expected, forbidden in EDGE_CASES
+        )
+    )
 
-:figure:
-  :path: chart2.html
-::
 
-:figure:
-  :path: chart3.html
-::
-
-End of document.
-::"""
-            
-            response = await client.post("/render", json={"source": rsm_source})
-            assert response.status_code == 200
-            
-            rendered_html = response.json()
-            
-            # Verify all figures are included
-            assert "Multiple Figures Test" in rendered_html
-            assert "Chart 1 Content" in rendered_html
-            assert "Chart 2 Content" in rendered_html
-            assert "Chart 3 Content" in rendered_html
-            assert "Some text between figures" in rendered_html
-            assert "End of document" in rendered_html
-            
-            # Verify resolver was called for each file (order may vary)
-            actual_calls = [call[0][0] for call in mock_resolver.resolve_asset.call_args_list]
-            expected_files = {"chart1.html", "chart2.html", "chart3.html"}
-            assert set(actual_calls) == expected_files
-            assert len(actual_calls) == 3
+async def test_render_with_multiple_figures(client: AsyncClient):
+    """Test that public render endpoint handles multiple figures correctly."""
+    # Back the mocked resolver with a plain dict; the resolver is the unit
+    # under mock, so no filesystem is needed
+    test_files = {
+        "chart1.html": "<div class='chart1'>Chart 1 Content</div>",
+        "chart2.html": "<div class='chart2'>Chart 2 Content</div>",
+        "chart3.html": "<div class='chart3'>Chart 3 Content</div>"
+    }
+
+    # Mock the shared static resolver
+    with patch('aris.crud.render._STATIC_RESOLVER') as mock_resolver:
+        mock_resolver.resolve_asset.side_effect = test_files.get
+
+        response = await client.post("/render", json={"source": MULTIPLE_FIGURES_SOURCE})
+        assert response.status_code == 200
+
+        rendered_html = orjson.loads(response.content)
+
+        # Verify all figures are included
+        assert "Multiple Figures Test" in rendered_html
+        assert "Chart 1 Content" in rendered_html
+        assert "Chart 2 Content" in rendered_html
+        assert "Chart 3 Content" in rendered_html
+        assert "Some text between figures" in rendered_html
+        assert "End of document" in rendered_html
+
+        # Verify resolver was called for each file (order may vary)
+        actual_calls = [call[0][0] for call in mock_resolver.resolve_asset.call_args_list]
+        expected_files = {"chart1.html", "chart2.html", "chart3.html"}
+        assert set(actual_calls) == expected_files
+        assert len(actual_calls) == 3
+
+
+# Large HTML content (~100KB), built once with join instead of repeated
+# string concatenation
+LARGE_CHART_HTML = "".join([
+    "<div class='large-chart'>\n",
+    "  <!-- Large chart content -->\n" * 3000,  # ~90KB
+    "  <h3>Large Chart Title</h3>\n",
+    "  <p>This is a large chart file for testing.</p>\n",
+    "</div>",
+])
 
 
 async def test_render_with_large_static_file(client: AsyncClient):
     """Test that public render endpoint handles large static files appropriately."""
-    # Create temporary static directory and large file
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_static_dir = Path(temp_dir)
-        large_file_path = temp_static_dir / "large_chart.html"
-        
-        # Create a large HTML content (100KB)
-        large_content = "<div class='large-chart'>\n"
-        large_content += "  <!-- Large chart content -->\n" * 3000  # ~90KB
-        large_content += "  <h3>Large Chart Title</h3>\n"
-        large_content += "  <p>This is a large chart file for testing.</p>\n"
-        large_content += "</div>"
-        
-        large_file_path.write_text(large_content, encoding='utf-8')
-        
-        # Mock the StaticFileAssetResolver
-        with patch('aris.crud.render.StaticFileAssetResolver') as mock_resolver_class:
-            mock_resolver = mock_resolver_class.return_value
-            
-            def mock_resolve_asset(path: str):
-                asset_path = temp_static_dir / path
-                if asset_path.exists():
-                    return asset_path.read_text(encoding='utf-8')
-                return None
-            
-            mock_resolver.resolve_asset.side_effect = mock_resolve_asset
-            
-            # Test RSM with large figure
-            rsm_source = """:rsm:
-# Large File Test
+    # Mock the shared static resolver, backed by an in-memory dict
+    with patch('aris.crud.render._STATIC_RESOLVER') as mock_resolver:
+        mock_resolver.resolve_asset.side_effect = {"large_chart.html": LARGE_CHART_HTML}.get
 
-:figure:
-  :path: large_chart.html
-::
+        response = await client.post("/render", json={"source": LARGE_FIGURE_SOURCE})
+        assert response.status_code == 200
 
-End of document.
-::"""
-            
-            response = await client.post("/render", json={"source": rsm_source})
-            assert response.status_code == 200
-            
-            rendered_html = response.json()
-            
-            # Verify large file content is included
-            assert "Large File Test" in rendered_html
-            assert "Large Chart Title" in rendered_html
-            assert "This is a large chart file for testing" in rendered_html
-            assert "End of document" in rendered_html
-            assert "large-chart" in rendered_html
-            
-            # Verify the response is reasonably large (indicates file was loaded)
-            assert len(rendered_html) > 50000  # Should be quite large due to included content
+        rendered_html = orjson.loads(response.content)
+
+        # Verify large file content is included
+        assert "Large File Test" in rendered_html
+        assert "Large Chart Title" in rendered_html
+        assert "This is a large chart file for testing" in rendered_html
+        assert "End of document" in rendered_html
+        assert "large-chart" in rendered_html
+
+        # Verify the response is reasonably large (indicates file was loaded)
+        assert len(rendered_html) > 50000  # Should be quite large due to included content
@@ -1,11 +1,60 @@
 """Tests for FileAssetResolver service."""
 
+import time
 from datetime import datetime, timezone
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from aris.crud.file_assets import FileAssetDB, FileAssetUpdate
 from aris.models.models import FileAsset
-from aris.services.asset_resolver import FileAssetResolver
+from aris.services import asset_resolver
+from aris.services.asset_resolver import FileAssetResolver, referenced_asset_paths
+
+
+async def seed_assets(session: AsyncSession, rows: list[dict]) -> None:
+    """Insert asset rows with one Core statement, skipping ORM unit-of-work."""
+    await session.execute(insert(FileAsset), rows)
+    await session.commit()
+
+
+class TestReferencedAssetPaths:
+    """Test extraction of :path: references from RSM source."""
+
+    def test_extracts_referenced_paths(self):
+        """Test that :path: filenames are collected from the source."""
+        src = """:rsm:
+:figure:
+  :path: chart.html
+::
+
+:figure:
+  :path: data.json
+::
+::"""
+        assert referenced_asset_paths(src) == {"chart.html", "data.json"}
+
+    def test_extracts_paths_with_spaces(self):
+        """Test that filenames containing spaces are captured whole."""
+        src = """:rsm:
+:figure:
+  :path: test file with spaces & symbols!.html
+::
+::"""
+        assert referenced_asset_paths(src) == {"test file with spaces & symbols!.html"}
+
+    def test_empty_path_captures_nothing(self):
+        """Test that a :path: tag with no filename yields no reference."""
+        src = """:rsm:
+:figure:
+  :path:
+::
+::"""
+        assert referenced_asset_paths(src) == set()
+
+    def test_no_references(self):
+        """Test that a source without :path: tags yields an empty set."""
+        assert referenced_asset_paths(":rsm: no figures here ::") == set()
 
 
 class TestFileAssetResolver:
@@ -33,17 +82,26 @@ class TestFileAssetResolver:
         # Test non-existent asset
         assert resolver.resolve_asset("missing.js") is None
 
+    def test_resolver_with_zstd_asset(self):
+        """Test resolver decompresses zstd-encoded assets."""
+        import zstandard
+
+        compressed = zstandard.ZstdCompressor(level=3).compress(b"<div>Compressed</div>")
+        resolver = FileAssetResolver({"figure.html": (compressed, "zstd")})
+
+        assert resolver.resolve_asset("figure.html") == "<div>Compressed</div>"
+
     async def test_create_for_file_with_assets(self, db_session: AsyncSession, test_file):
         """Test creating resolver for file with assets."""
-        asset = FileAsset(
-            filename="merge_sort_embed.html",
-            mime_type="text/html",
-            content="<div>Merge Sort Algorithm</div>",
-            file_id=test_file.id,
-            owner_id=test_file.owner_id
-        )
-        db_session.add(asset)
-        await db_session.commit()
+        await seed_assets(db_session, [
+            {
+                "filename": "merge_sort_embed.html",
+                "mime_type": "text/html",
+                "content": "<div>Merge Sort Algorithm</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+            }
+        ])
 
         resolver = await FileAssetResolver.create_for_file(test_file.id, db_session)
 
@@ -58,59 +116,81 @@ class TestFileAssetResolver:
 
     async def test_create_for_file_ignores_deleted_assets(self, db_session: AsyncSession, test_file):
         """Test that deleted assets are not included in resolver."""
-        asset1 = FileAsset(
-            filename="active.html",
-            mime_type="text/html",
-            content="<div>Active</div>",
-            file_id=test_file.id,
-            owner_id=test_file.owner_id
-        )
-
-        asset2 = FileAsset(
-            filename="deleted.html",
-            mime_type="text/html",
-            content="<div>Deleted</div>",
-            file_id=test_file.id,
-            owner_id=test_file.owner_id,
-            deleted_at=datetime.now(timezone.utc)
-        )
-
-        db_session.add_all([asset1, asset2])
-        await db_session.commit()
+        await seed_assets(db_session, [
+            {
+                "filename": "active.html",
+                "mime_type": "text/html",
+                "content": "<div>Active</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+                "deleted_at": None,
+            },
+            {
+                "filename": "deleted.html",
+                "mime_type": "text/html",
+                "content": "<div>Deleted</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+                "deleted_at": datetime.now(timezone.utc),
+            },
+        ])
 
         resolver = await FileAssetResolver.create_for_file(test_file.id, db_session)
 
         assert resolver.resolve_asset("active.html") == "<div>Active</div>"
         assert resolver.resolve_asset("deleted.html") is None
 
+    async def test_create_for_file_with_filename_subset(self, db_session: AsyncSession, test_file):
+        """Test that only requested filenames are loaded when a subset is given."""
+        await seed_assets(db_session, [
+            {
+                "filename": "referenced.html",
+                "mime_type": "text/html",
+                "content": "<div>Referenced</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+            },
+            {
+                "filename": "unreferenced.html",
+                "mime_type": "text/html",
+                "content": "<div>Unreferenced</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+            },
+        ])
+
+        resolver = await FileAssetResolver.create_for_file(
+            test_file.id, db_session, filenames={"referenced.html"}
+        )
+
+        assert resolver.resolve_asset("referenced.html") == "<div>Referenced</div>"
+        assert resolver.resolve_asset("unreferenced.html") is None
+
     async def test_create_for_file_multiple_assets(self, db_session: AsyncSession, test_file):
         """Test resolver with multiple assets for same file."""
-        assets = [
-            FileAsset(
-                filename="chart.html",
-                mime_type="text/html",
-                content="<div>Chart</div>",
-                file_id=test_file.id,
-                owner_id=test_file.owner_id
-            ),
-            FileAsset(
-                filename="data.json",
-                mime_type="application/json",
-                content='{"values": [1, 2, 3]}',
-                file_id=test_file.id,
-                owner_id=test_file.owner_id
-            ),
-            FileAsset(
-                filename="style.css",
-                mime_type="text/css",
-                content="body { font-family: Arial; }",
-                file_id=test_file.id,
-                owner_id=test_file.owner_id
-            )
-        ]
-
-        db_session.add_all(assets)
-        await db_session.commit()
+        await seed_assets(db_session, [
+            {
+                "filename": "chart.html",
+                "mime_type": "text/html",
+                "content": "<div>Chart</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+            },
+            {
+                "filename": "data.json",
+                "mime_type": "application/json",
+                "content": '{"values": [1, 2, 3]}',
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+            },
+            {
+                "filename": "style.css",
+                "mime_type": "text/css",
+                "content": "body { font-family: Arial; }",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+            },
+        ])
 
         resolver = await FileAssetResolver.create_for_file(test_file.id, db_session)
 
@@ -118,3 +198,150 @@ class TestFileAssetResolver:
         assert resolver.resolve_asset("data.json") == '{"values": [1, 2, 3]}'
         assert resolver.resolve_asset("style.css") == "body { font-family: Arial; }"
         assert resolver.resolve_asset("missing.txt") is None
+
+
+# A fixed past timestamp for seeded rows. SQLite's now() has one-second
+# granularity, so rows stamped at test time could collide with a write
+# issued in the same second; a fixed past value keeps signature comparisons
+# deterministic on both backends.
+PAST = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class TestResolverCache:
+    """Test the process-level resolver cache and its signature invalidation."""
+
+    async def test_unchanged_assets_reuse_cached_resolver(
+        self, db_session: AsyncSession, test_file
+    ):
+        """Test that repeat loads of an unchanged file return the cached instance."""
+        await seed_assets(db_session, [
+            {
+                "filename": "stable.html",
+                "mime_type": "text/html",
+                "content": "<div>Stable</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+                "uploaded_at": PAST,
+                "updated_at": PAST,
+            }
+        ])
+
+        first = await FileAssetResolver.create_for_file(test_file.id, db_session)
+        second = await FileAssetResolver.create_for_file(test_file.id, db_session)
+
+        assert second is first
+
+    async def test_new_asset_moves_signature(self, db_session: AsyncSession, test_file):
+        """Test that adding an asset invalidates the cached resolver."""
+        await seed_assets(db_session, [
+            {
+                "filename": "first.html",
+                "mime_type": "text/html",
+                "content": "<div>First</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+                "uploaded_at": PAST,
+                "updated_at": PAST,
+            }
+        ])
+        stale = await FileAssetResolver.create_for_file(test_file.id, db_session)
+
+        await seed_assets(db_session, [
+            {
+                "filename": "second.html",
+                "mime_type": "text/html",
+                "content": "<div>Second</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+                "uploaded_at": PAST,
+                "updated_at": PAST,
+            }
+        ])
+        fresh = await FileAssetResolver.create_for_file(test_file.id, db_session)
+
+        assert fresh is not stale
+        assert fresh.resolve_asset("second.html") == "<div>Second</div>"
+
+    async def test_content_update_moves_signature(
+        self, db_session: AsyncSession, test_file
+    ):
+        """Test that an in-place content update invalidates the cached resolver.
+
+        ``update_asset`` bumps ``updated_at``, which must move the aggregate
+        signature even though the row count and upload timestamps are
+        unchanged — this is what keeps other worker processes from serving
+        stale content.
+        """
+        asset = FileAsset(
+            filename="edited.html",
+            mime_type="text/html",
+            content="PGRpdj5PbGQ8L2Rpdj4=",  # base64("<div>Old</div>")
+            content_encoding="base64",
+            file_id=test_file.id,
+            owner_id=test_file.owner_id,
+            uploaded_at=PAST,
+            updated_at=PAST,
+        )
+        db_session.add(asset)
+        await db_session.commit()
+
+        stale = await FileAssetResolver.create_for_file(test_file.id, db_session)
+        assert stale.resolve_asset("edited.html") == "<div>Old</div>"
+
+        await FileAssetDB.update_asset(
+            asset,
+            FileAssetUpdate(content="PGRpdj5OZXc8L2Rpdj4="),  # base64("<div>New</div>")
+            db_session,
+        )
+        fresh = await FileAssetResolver.create_for_file(test_file.id, db_session)
+
+        assert fresh is not stale
+        assert fresh.resolve_asset("edited.html") == "<div>New</div>"
+
+    async def test_cache_entry_expires_after_ttl(
+        self, db_session: AsyncSession, test_file
+    ):
+        """Test that a cached resolver is reloaded once its TTL has elapsed."""
+        await seed_assets(db_session, [
+            {
+                "filename": "aging.html",
+                "mime_type": "text/html",
+                "content": "<div>Aging</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+                "uploaded_at": PAST,
+                "updated_at": PAST,
+            }
+        ])
+        stale = await FileAssetResolver.create_for_file(test_file.id, db_session)
+
+        # Age the entry past the TTL instead of sleeping through it
+        signature, _, resolver = asset_resolver._resolver_cache[test_file.id]
+        expired_at = time.monotonic() - asset_resolver._CACHE_TTL_SECONDS - 1
+        asset_resolver._resolver_cache[test_file.id] = (signature, expired_at, resolver)
+
+        fresh = await FileAssetResolver.create_for_file(test_file.id, db_session)
+
+        assert fresh is not stale
+
+    async def test_invalidate_cache_drops_entry(
+        self, db_session: AsyncSession, test_file
+    ):
+        """Test that explicit invalidation forces a reload for that file."""
+        await seed_assets(db_session, [
+            {
+                "filename": "dropped.html",
+                "mime_type": "text/html",
+                "content": "<div>Dropped</div>",
+                "file_id": test_file.id,
+                "owner_id": test_file.owner_id,
+                "uploaded_at": PAST,
+                "updated_at": PAST,
+            }
+        ])
+        stale = await FileAssetResolver.create_for_file(test_file.id, db_session)
+
+        asset_resolver.invalidate_cache(test_file.id)
+        fresh = await FileAssetResolver.create_for_file(test_file.id, db_session)
+
+        assert fresh is not stale
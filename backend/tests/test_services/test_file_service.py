@@ -691,28 +691,42 @@ class TestInMemoryFileServiceAssetIntegration:
             owner_id=123
         )
         
-        # Mock the database execute call to return our test asset
-        from unittest.mock import AsyncMock
-        
-        # Create proper mock for the database query result
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [test_asset]
-        
+        # Mock the signature aggregate query (execute) and the streamed
+        # projection query (stream) that create_for_file issues
+        from datetime import datetime, timezone
+
         mock_result = MagicMock()
-        mock_result.scalars.return_value = mock_scalars
-        
-        # Mock db.execute to return our mock result
+        mock_result.one.return_value = (1, datetime.now(timezone.utc), None)
         mock_db.execute = AsyncMock(return_value=mock_result)
-        
+
+        asset_row = {
+            "filename": test_asset.filename,
+            "content": test_asset.content,
+            "content_bytes": None,
+            "content_encoding": test_asset.content_encoding,
+        }
+
+        class FakeStreamResult:
+            def mappings(self):
+                return self
+
+            def __aiter__(self):
+                async def rows():
+                    yield asset_row
+
+                return rows()
+
+        mock_db.stream = AsyncMock(return_value=FakeStreamResult())
+
         # Get HTML rendering with database session - should use asset resolver
         html = await file_service.get_file_html(created_file.id, db=mock_db)
-        
+
         # Should contain the resolved asset content embedded in the HTML
         assert html is not None
         assert "Test Asset Content" in html  # Asset content should be embedded
-        
+
         # Verify that the database was actually queried for assets
-        mock_db.execute.assert_called_once()
+        mock_db.stream.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_get_file_html_falls_back_without_db_session(self, file_service):